@@ -13,7 +13,8 @@ class ACO:
         n_iterations: int = 1000,
         decay: float = 0.5,
         alpha: float = 1.0,
-        beta: float = 1.0
+        beta: float = 1.0,
+        track_memory: bool = True
     ) -> None:
         """
         Initialize the Ant Colony Optimization algorithm.
@@ -25,6 +26,7 @@ class ACO:
             decay: The rate at which pheromone trails evaporate over time.
             alpha: Influence of pheromone strength on city selection.
             beta: Influence of heuristic (1/distance) on city selection.
+            track_memory: Whether to measure memory usage (runs the search a second time).
         """
         self.distances: np.ndarray = np.array(distances)
         self.pheromones: np.ndarray = np.ones(self.distances.shape) / len(self.distances)
@@ -33,6 +35,7 @@ class ACO:
         self.decay: float = decay
         self.alpha: float = alpha
         self.beta: float = beta
+        self.track_memory: bool = track_memory
 
     def run(self) -> Tuple[List[int], float]:
         """
@@ -64,18 +67,22 @@ class ACO:
         Solve the TSP using the ACO algorithm and track memory usage.
 
         Returns:
-            dict: Contains cost, path, number of iterations, and memory usage in bytes.
+            dict: Contains cost, path, number of iterations, and memory usage in bytes
+            (only when track_memory is set).
         """
         shortest_path, shortest_distance = self.run()
-        mem: List[float] = memory_usage(self.run)
-
-        return {
+        result = {
             "cost": shortest_distance,
             "path": shortest_path,
-            "iterations": self.n_iterations,
-            "memory_bytes": sum(mem)
+            "iterations": self.n_iterations
         }
 
+        if self.track_memory:
+            mem: List[float] = memory_usage(self.run)
+            result["memory_bytes"] = sum(mem)
+
+        return result
+
     def _construct_solutions(self) -> List[List[int]]:
         """
         Construct solutions (paths) for all ants.
@@ -6,14 +6,16 @@ from typing import List
 class DP:
     """Dynamic Programming-based solution for the Traveling Salesman Problem (TSP)."""
 
-    def __init__(self, distance_matrix: List[List[float]]):
+    def __init__(self, distance_matrix: List[List[float]], track_memory: bool = True):
         """
         Initializes the DP solver with a distance matrix.
 
         Args:
             distance_matrix (List[List[float]]): A 2D list representing pairwise distances between nodes.
+            track_memory (bool): Whether to measure peak memory usage with tracemalloc.
         """
         self.distance = distance_matrix
+        self.track_memory = track_memory
         self.n = len(distance_matrix)
         self.memo = {}
         self.parent = {}
@@ -28,23 +30,27 @@ class DP:
                 - 'cost' (float): Total cost of the shortest path.
                 - 'path' (List[int]): Order of visited nodes (including return to start).
                 - 'iterations' (int): Number of recursive calls made.
-                - 'memory_bytes' (int): Peak memory usage during execution in bytes.
+                - 'memory_bytes' (int): Peak memory usage during execution in bytes (only when track_memory is set).
         """
-        tracemalloc.start()
+        if self.track_memory:
+            tracemalloc.start()
 
         min_cost = self._tsp(0, 1)
         path = self._reconstruct_path()
 
-        current, peak = tracemalloc.get_traced_memory()
-        tracemalloc.stop()
-
-        return {
+        result = {
             "cost": min_cost,
             "path": path,
-            "iterations": self.iterations,
-            "memory_bytes": peak
+            "iterations": self.iterations
         }
 
+        if self.track_memory:
+            current, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            result["memory_bytes"] = peak
+
+        return result
+
     def _tsp(self, pos: int, visited: int) -> float:
         """
         Recursive helper method that computes the minimum cost using DP.
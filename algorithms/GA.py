@@ -17,6 +17,7 @@ class GA:
         elitism: Percentage of elites to preserve between generations
         max_gens: Maximum number of generations to evolve
         early_stop: Early stopping criteria for convergence
+        track_memory: Whether peak memory usage is measured
         num_nodes: Number of nodes in the problem
         iterations: Number of generations evolved
         best_cost: Best solution cost found
@@ -32,7 +33,8 @@ class GA:
         crossover_rate: float = 0.9,
         elitism: float = 0.1,
         max_generations: int = 1000,
-        early_stopping: int = 1000
+        early_stopping: int = 1000,
+        track_memory: bool = True
     ) -> None:
         """Initialize GA solver with problem parameters.
 
@@ -44,6 +46,7 @@ class GA:
             elitism: Percentage of population to preserve as elites [0-1]
             max_generations: Maximum number of generations to evolve
             early_stopping: Stop if no improvement for this many generations
+            track_memory: Measure peak memory usage with tracemalloc
 
         Raises:
             ValueError: If invalid parameters are provided
@@ -55,6 +58,7 @@ class GA:
         self.elitism: float = elitism
         self.max_gens: int = max_generations
         self.early_stop: int = early_stopping
+        self.track_memory: bool = track_memory
 
         self.num_nodes: int = len(distance_matrix)
         self.iterations: int = 0
@@ -173,8 +177,10 @@ class GA:
             - path: Best solution node order (starts and ends at 0)
             - iterations: Number of generations evolved
             - memory_bytes: Peak memory usage during optimization
+              (only when track_memory is set)
         """
-        tracemalloc.start()
+        if self.track_memory:
+            tracemalloc.start()
         self._initialize_population()
         no_improve = 0
         elite_size = int(self.pop_size * self.elitism)
@@ -216,14 +222,17 @@ class GA:
         # Complete the cycle by returning to start node
         self.best_path.append(0)
 
-        # Get memory usage statistics
-        _, peak = tracemalloc.get_traced_memory()
-        tracemalloc.stop()
-
-        return {
+        result = {
             "cost": self.best_cost,
             "path": self.best_path,
-            "iterations": self.iterations,
-            "memory_bytes": peak
+            "iterations": self.iterations
         }
+
+        # Get memory usage statistics
+        if self.track_memory:
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            result["memory_bytes"] = peak
+
+        return result
     
\ No newline at end of file
@@ -0,0 +1,263 @@
+import math
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Dict, Iterator, List, Optional
+from utils.utils import *
+from main import ALGORITHMS, GRAPH_JSON_PATH
+
+# =======================
+# Configurable Parameters
+# =======================
+DP_MAX_SIZE = 16
+HEURISTIC = 'ga'
+HEURISTIC_PARAMS = {}
+MAX_WORKERS = os.cpu_count()
+
+# Full distance matrix of the dataset, set once per worker by _init_worker
+_distances: Optional[List[List[float]]] = None
+
+
+def _init_worker(distances: List[List[float]]) -> None:
+    """Store the shared distance matrix in the worker so it is sent only once."""
+    global _distances
+    _distances = distances
+
+
+def _solve_instance(
+    index: int,
+    instance: list,
+    node_ids: Optional[List[int]],
+    algorithm_key: str,
+    params: Dict[str, Any]
+) -> Dict[str, Any]:
+    """Solve a single instance inside a worker process.
+
+    Args:
+        index: Position of the instance in the submitted batch.
+        instance: Distance matrix, or matrix indices into the shared distance
+            matrix when node_ids is given.
+        node_ids: Dataset node ids of the instance, None for distance matrices.
+        algorithm_key: Key of the algorithm in ALGORITHMS to solve with.
+        params: Extra keyword arguments for the algorithm constructor.
+
+    Returns:
+        Solver result extended with index, algorithm, size and execution time.
+    """
+    start_time = time.time()
+    try:
+        graph = instance if node_ids is None else get_sub_distances(_distances, instance)
+        result = ALGORITHMS[algorithm_key](graph, track_memory=False, **params).solve()
+        if not math.isfinite(result['cost']):
+            raise ValueError("No finite tour found")
+        if node_ids is not None:
+            result['path'] = [node_ids[i] for i in result['path']]
+    except Exception as e:
+        result = {'error': str(e)}
+
+    result.update({
+        'index': index,
+        'algorithm': algorithm_key,
+        'size': len(instance),
+        'execution_time': time.time() - start_time
+    })
+    return result
+
+
+class BatchSolver:
+    """Solves many small independent TSP instances on a persistent pool of workers.
+
+    Workers are spawned once and receive the full distance matrix of the dataset
+    at start-up, so process spawn, imports and geodesic distance computation are
+    paid once per pool instead of once per instance. Solvers run without memory
+    profiling, so results carry no memory_bytes. If a worker dies, the pending
+    instances are reported as errors and the pool is restarted on the next use.
+
+    Attributes:
+        nodes: Dataset nodes that subset instances refer to by id
+        dp_max_size: Largest instance size solved exactly with DP
+        heuristic: Algorithm key used above dp_max_size
+        heuristic_params: Keyword arguments passed to the heuristic solver
+    """
+
+    def __init__(
+        self,
+        nodes: List[dict],
+        max_workers: Optional[int] = MAX_WORKERS,
+        dp_max_size: int = DP_MAX_SIZE,
+        heuristic: str = HEURISTIC,
+        heuristic_params: Optional[Dict[str, Any]] = None
+    ) -> None:
+        """Build the dataset distance matrix and start the worker pool.
+
+        Args:
+            nodes: List of nodes as returned by get_data
+            max_workers: Number of worker processes
+            dp_max_size: Largest instance size solved exactly with DP
+            heuristic: Algorithm key ('aco' or 'ga') used above dp_max_size
+            heuristic_params: Keyword arguments for the heuristic, e.g.
+                {'max_generations': 200} for GA or {'n_iterations': 100} for ACO
+
+        Raises:
+            ValueError: If heuristic is not a known algorithm key
+        """
+        if heuristic not in ALGORITHMS:
+            raise ValueError(f"Unknown algorithm: {heuristic}")
+
+        self.nodes: List[dict] = nodes
+        self.dp_max_size: int = dp_max_size
+        self.heuristic: str = heuristic
+        self.heuristic_params: Dict[str, Any] = dict(HEURISTIC_PARAMS if heuristic_params is None else heuristic_params)
+
+        self._node_index: Dict[int, int] = {node['id']: i for i, node in enumerate(nodes)}
+        self._max_workers: Optional[int] = max_workers
+        self._distances: List[List[float]] = get_distances(nodes, len(nodes))
+        self._start_pool()
+
+    def _start_pool(self) -> None:
+        """Start a fresh worker pool holding the dataset distance matrix."""
+        self._executor = ProcessPoolExecutor(
+            max_workers=self._max_workers,
+            initializer=_init_worker,
+            initargs=(self._distances,)
+        )
+
+    def _restart_pool(self) -> None:
+        """Replace a broken worker pool with a new one."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self._start_pool()
+
+    def _prepare(self, instance: list) -> tuple:
+        """Validate an instance and map node ids to distance matrix indices.
+
+        Args:
+            instance: List of node ids or a square distance matrix
+
+        Returns:
+            Tuple of the instance to solve and its node ids (None for matrices)
+
+        Raises:
+            ValueError: If the instance is degenerate or refers to unknown nodes
+        """
+        if len(instance) < 2:
+            raise ValueError("Instance must contain at least 2 nodes")
+
+        if hasattr(instance[0], '__len__'):
+            if any(len(row) != len(instance) for row in instance):
+                raise ValueError("Distance matrix must be square")
+            if any(instance[i][j] <= 0 for i in range(len(instance)) for j in range(len(instance)) if i != j):
+                raise ValueError("Distance matrix must have positive off-diagonal entries")
+            return instance, None
+
+        node_ids = list(instance)
+        if len(set(node_ids)) != len(node_ids):
+            raise ValueError("Instance contains repeated node ids")
+        unknown = [i for i in node_ids if i not in self._node_index]
+        if unknown:
+            raise ValueError(f"Unknown node ids: {unknown}")
+        return [self._node_index[i] for i in node_ids], node_ids
+
+    def solve(self, instances: List[list]) -> Iterator[Dict[str, Any]]:
+        """Solve a batch of instances, yielding results as they finish.
+
+        Each instance is either a list of node ids from the dataset (the first
+        id is the start of the tour) or a square distance matrix. Instances are
+        submitted smallest first, one task each, so cheap tours are not held
+        back behind expensive ones. Instances still pending when the stream
+        is closed early are cancelled.
+
+        Args:
+            instances: List of node id lists and/or distance matrices
+
+        Yields:
+            Solver result (cost, path, iterations, or error)
+            extended with the instance index, algorithm, size and
+            execution_time. Paths of node id instances are given in node ids.
+        """
+        tasks = []
+        for index, instance in enumerate(instances):
+            try:
+                tasks.append((index, *self._prepare(instance)))
+            except Exception as e:
+                yield {
+                    'error': str(e),
+                    'index': index,
+                    'algorithm': None,
+                    'size': len(instance) if hasattr(instance, '__len__') else 0,
+                    'execution_time': 0.0
+                }
+
+        tasks.sort(key=lambda task: len(task[1]))
+        futures = {}
+        broken = False
+        try:
+            for index, instance, node_ids in tasks:
+                if len(instance) <= self.dp_max_size:
+                    algorithm_key, params = 'dp', {}
+                else:
+                    algorithm_key, params = self.heuristic, self.heuristic_params
+                try:
+                    future = self._executor.submit(_solve_instance, index, instance, node_ids, algorithm_key, params)
+                except BrokenProcessPool:
+                    self._restart_pool()
+                    future = self._executor.submit(_solve_instance, index, instance, node_ids, algorithm_key, params)
+                futures[future] = (index, algorithm_key, len(instance))
+
+            for future in as_completed(futures):
+                try:
+                    yield future.result()
+                except Exception as e:
+                    broken = broken or isinstance(e, BrokenProcessPool)
+                    index, algorithm_key, size = futures[future]
+                    yield {
+                        'error': str(e) or type(e).__name__,
+                        'index': index,
+                        'algorithm': algorithm_key,
+                        'size': size,
+                        'execution_time': 0.0
+                    }
+        finally:
+            for future in futures:
+                future.cancel()
+            if broken:
+                self._restart_pool()
+
+    def close(self, cancel_futures: bool = False) -> None:
+        """Shut down the worker pool.
+
+        Args:
+            cancel_futures: Cancel queued instances instead of waiting for them
+        """
+        self._executor.shutdown(cancel_futures=cancel_futures)
+
+    def __enter__(self) -> 'BatchSolver':
+        return self
+
+    def __exit__(self, exc_type, *exc) -> None:
+        self.close(cancel_futures=exc_type is not None)
+
+
+# ========================
+# Main Execution
+# ========================
+def main():
+    nodes = get_data(GRAPH_JSON_PATH)
+    ids = [node['id'] for node in nodes]
+    instances = [[0] + random.sample(ids[1:], random.randint(7, 14)) for _ in range(64)]
+
+    start_time = time.time()
+    with BatchSolver(nodes) as batch:
+        for result in batch.solve(instances):
+            if 'error' in result:
+                print(f"#{result['index']} error | Size: {result['size']}: {result['error']}")
+                continue
+            print(f"#{result['index']} {result['algorithm'].upper()} | Size: {result['size']} | "
+                  f"{result['execution_time']:.3f}s | {result['cost']:.2f}m | "
+                  f"{' -> '.join(map(str, result['path']))}")
+    total_time = time.time() - start_time
+    print(f"\nSolved {len(instances)} instances in {total_time:.3f}s ({len(instances) / total_time:.1f} req/s)")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,105 @@
+import os
+import time
+import numpy as np
+import pytest
+from batch import BatchSolver
+from main import ALGORITHMS, GRAPH_JSON_PATH
+from utils.utils import get_data
+
+DP_MAX_SIZE = 5
+HEURISTIC_PARAMS = {'max_generations': 5, 'early_stopping': 5}
+
+
+class CrashingSolver:
+    """Solver stand-in that kills the worker process running it."""
+
+    def __init__(self, *args, **kwargs):
+        os._exit(1)
+
+
+@pytest.fixture(scope='module')
+def nodes():
+    return get_data(GRAPH_JSON_PATH)
+
+
+@pytest.fixture(scope='module')
+def batch(nodes):
+    with BatchSolver(nodes, max_workers=2, dp_max_size=DP_MAX_SIZE, heuristic_params=HEURISTIC_PARAMS) as solver:
+        yield solver
+
+
+def test_one_result_per_instance(batch):
+    instances = [[0, 3, 5, 7], [4, 1, 2], [0, 1, 2, 3, 4, 5, 6, 7], [[0, 1], [1, 0]]]
+    results = list(batch.solve(instances))
+
+    assert sorted(result['index'] for result in results) == list(range(len(instances)))
+    for result in results:
+        assert 'error' not in result
+        assert 'memory_bytes' not in result
+        assert result['size'] == len(instances[result['index']])
+
+
+def test_subset_path_uses_node_ids(batch):
+    instance = [5, 2, 8, 1, 30]
+    result, = batch.solve([instance])
+
+    assert result['path'][0] == result['path'][-1] == 5
+    assert sorted(result['path'][:-1]) == sorted(instance)
+
+
+def test_algorithm_selected_by_size(batch):
+    results = {r['index']: r for r in batch.solve([[0, 1, 2, 3, 4], [0, 1, 2, 3, 4, 5]])}
+
+    assert results[0]['algorithm'] == 'dp'
+    assert results[1]['algorithm'] == 'ga'
+    assert results[1]['iterations'] <= HEURISTIC_PARAMS['max_generations']
+
+
+def test_numpy_distance_matrix(batch):
+    matrix = np.array([[0.0, 1.0, 2.0], [1.0, 0.0, 1.0], [2.0, 1.0, 0.0]])
+    result, = batch.solve([matrix])
+
+    assert result['cost'] == pytest.approx(4.0)
+    assert result['path'] == [0, 1, 2, 0]
+
+
+@pytest.mark.parametrize('instance', [
+    [], [0], [0, 1, 1], [0, 999], [[0, 0, 1], [0, 0, 1], [1, 1, 0]]
+])
+def test_invalid_instance_returns_error(batch, instance):
+    results = list(batch.solve([[0, 1, 2], instance]))
+
+    errors = [result for result in results if 'error' in result]
+    assert len(results) == 2
+    assert len(errors) == 1 and errors[0]['index'] == 1
+
+
+def test_abandoned_stream_cancels_pending(nodes):
+    params = {'max_generations': 150, 'early_stopping': 150}
+    instances = [list(range(10)) for _ in range(12)]
+
+    with BatchSolver(nodes, max_workers=1, dp_max_size=DP_MAX_SIZE, heuristic_params=params) as solver:
+        list(solver.solve([[0, 1, 2]]))
+
+        start_time = time.time()
+        for _ in solver.solve(instances):
+            break
+        per_instance = time.time() - start_time
+
+        start_time = time.time()
+        result, = solver.solve([[0, 1, 2]])
+        assert 'error' not in result
+        assert time.time() - start_time < per_instance * 4
+
+
+def test_broken_pool_reports_errors_and_recovers(nodes, monkeypatch):
+    with BatchSolver(nodes, max_workers=2) as solver:
+        monkeypatch.setitem(ALGORITHMS, 'dp', CrashingSolver)
+        results = list(solver.solve([[0, 1, 2], [0, 1, 2, 3]]))
+        monkeypatch.undo()
+
+        assert sorted(result['index'] for result in results) == [0, 1]
+        assert all('error' in result for result in results)
+
+        result, = solver.solve([[0, 1, 2]])
+        assert 'error' not in result
@@ -29,6 +29,11 @@ def get_distances(nodes: list, size: int) -> list:
     return graph
 
 
+def get_sub_distances(graph: list, indices: list) -> list:
+    """ Slices a precomputed distance matrix down to the given node indices """
+    return [[graph[i][j] for j in indices] for i in indices]
+
+
 # ========================
 # CSV Writing
 # ========================